@@ -1,17 +1,35 @@
 ﻿import argparse
+import asyncio
+import atexit
+import calendar
+import queue
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from html import unescape
 from datetime import datetime, timedelta
 from pathlib import Path
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from bs4 import BeautifulSoup
+import lxml.html
+import aiohttp
 import json
 import re
 import os
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    orjson = None
+    _loads = json.loads
+
 # Add the parent directory to the path so we can import the extractor
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
@@ -41,25 +59,122 @@ if extractor is None:
     print("Could not find the Senate extractor module. Make sure robust_senate_extractor.py is in the same directory.")
     sys.exit(1)
 
-# Configure logging
+# Configure logging - records go through a queue so worker threads never block on the log file
+log_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+log_handlers = [
+    logging.FileHandler('C:\\EMPIRE\\SATORI_Scraper\\enhanced_senate_scraper.log'),
+    logging.StreamHandler()
+]
+for log_handler in log_handlers:
+    log_handler.setFormatter(log_formatter)
+
+log_queue = queue.Queue(-1)
+log_listener = QueueListener(log_queue, *log_handlers, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
+
+# Records are formatted by the listener's handlers, so the queue side only passes the message on
+queue_handler = QueueHandler(log_queue)
+queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
+# force=True replaces the handlers the extractor module installed on import
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('C:\\EMPIRE\\SATORI_Scraper\\enhanced_senate_scraper.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[queue_handler],
+    force=True
 )
 logger = logging.getLogger(__name__)
 
+def _write_json(filepath, data):
+    """Write data as compact JSON, using orjson when it is installed"""
+    if orjson is not None:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data))
+    else:
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'))
+
+@dataclass(slots=True)
+class Report:
+    """A search result row pointing at one filed report"""
+    name: str
+    office: str
+    report_type: str
+    date_filed: str
+    link: str
+
+class RateLimiter:
+    """Token bucket limiting how many requests are started per second"""
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+# Rows requested per page from the search DataTables endpoint
+_SEARCH_PAGE_SIZE = 100
+
+# Report type ids used by the search form and its DataTables endpoint
+_ANNUAL_REPORT_TYPE = "7"
+_PTR_REPORT_TYPE = "11"
+
+# Search page locators
+_ANNUAL_CHECKBOX = (By.CSS_SELECTOR, f"input[name='report_type'][value='{_ANNUAL_REPORT_TYPE}']")
+_PTR_CHECKBOX = (By.CSS_SELECTOR, f"input[name='report_type'][value='{_PTR_REPORT_TYPE}']")
+_FROM_DATE = (By.CSS_SELECTOR, "input[name='fromDate'], #fromDate")
+_TO_DATE = (By.CSS_SELECTOR, "input[name='toDate'], #toDate")
+_SEARCH_BTN_TEXT = (By.XPATH, "//button[contains(text(), 'Search Reports')]")
+_SEARCH_BTN_PARTIAL_TEXT = (By.XPATH, "//button[contains(text(), 'Search')]")
+_SEARCH_BTN = (By.CSS_SELECTOR, "button.btn-primary, button[type='submit']")
+_RESULTS_TABLE = (By.CLASS_NAME, "table")
+_PROCESSING_INDICATOR = (By.ID, "filedReports_processing")
+
+# One filedReports row: first name, last name, office, report link and text, date filed
+_ROW_RE = re.compile(
+    r'<tr[^>]*>\s*<td[^>]*>([^<]*)</td>\s*<td[^>]*>([^<]*)</td>\s*<td[^>]*>([^<]*)</td>'
+    r'\s*<td[^>]*><a href="([^"]+)"[^>]*>([^<]+)</a></td>\s*<td[^>]*>([^<]*)</td>',
+    re.S
+)
+
+# Maps report names to safe file names in a single pass
+_FNAME_TABLE = str.maketrans({' ': '_', ',': '', '/': '_', '\\': '_'})
+
+# Report links in DataTable cells are a single anchor, so a regex is enough
+_HREF_RE = re.compile(r'href=["\']([^"\']+)["\']')
+_ANCHOR_TEXT_RE = re.compile(r'<a\b[^>]*>([^<]*)</a>')
+
 class EnhancedSenateScraperWithDirectURL(extractor):
     def __init__(self):
         super().__init__()
         self.base_dir = Path("C:\\EMPIRE\\SATORI_Scraper")
-        self.raw_dir = self.base_dir / "data" / "raw" / "senate"
+        self.raw_dir = Path(os.environ.get('SATORI_RAW_DIR', self.base_dir / "data" / "raw" / "senate"))
         self.raw_dir.mkdir(parents=True, exist_ok=True)
         self.session_established = False
         
+        # Upper bound on concurrent month searches during historical scrapes
+        self.max_concurrent_searches = 8
+        
+        # Report processing runs in a thread pool; prefetches and fetches share a 4 per second limit
+        self.max_workers = 6
+        self.rate_limiter = RateLimiter(rate=4)
+        
+        # Links of reports already saved under raw_dir, loaded by load_processed_urls
+        self.processed_urls = set()
+        
         # List of known report URLs that might not appear in search results
         self.known_report_urls = [
             "https://efdsearch.senate.gov/search/view/ptr/0bf421b2-cf4e-40d8-9c9f-98ba5e535c6c/"  # McCormick report
@@ -68,52 +183,8 @@ class EnhancedSenateScraperWithDirectURL(extractor):
     def establish_session_once(self):
         """Establish session only once and reuse it"""
         if not self.session_established:
-            logger.info("Establishing session with Senate website...")
-            
-            # Strategy 1: Standard Selenium approach - copied from working extractor
-            try:
-                self.driver.get(f"{self.base_url}/search/")
-                time.sleep(2)
-                
-                # Accept agreement - using the exact approach from the working extractor
-                agreement_checkbox = WebDriverWait(self.driver, 10).until(
-                    EC.element_to_be_clickable((By.ID, "agree_statement"))
-                )
-                agreement_checkbox.click()
-                logger.info("Accepted agreement via Selenium")
-                
-                # Transfer cookies to requests session
-                for cookie in self.driver.get_cookies():
-                    self.session.cookies.set(cookie['name'], cookie['value'])
-                
-                self.session_established = True
-                return True
-            except Exception as e:
-                logger.warning(f"Selenium session establishment failed: {e}")
-            
-            # Strategy 2: Direct requests approach - copied from working extractor
-            try:
-                logger.info("Trying direct requests approach...")
-                response = self.session.get(f"{self.base_url}/search/")
-                if "agree_statement" in response.text:
-                    # Find agreement form and submit
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    agreement_form = soup.find('form', {'id': 'agreement_form'})
-                    if agreement_form:
-                        action = agreement_form.get('action')
-                        if action:
-                            response = self.session.post(
-                                f"{self.base_url}{action}",
-                                data={'agree_statement': 'agree'}
-                            )
-                            if response.status_code == 200:
-                                logger.info("Accepted agreement via requests")
-                                self.session_established = True
-                                return True
-            except Exception as e:
-                logger.warning(f"Requests session establishment failed: {e}")
-            
-            return False
+            self.session_established = self.establish_session()
+            return self.session_established
         else:
             logger.info("Session already established")
             return True
@@ -128,31 +199,30 @@ class EnhancedSenateScraperWithDirectURL(extractor):
             return None
         
         # Create a report data object
-        report_data = {
-            'name': 'Direct URL Report',
-            'link': url,
-            'date_filed': 'Unknown',
-            'office': 'Unknown',
-            'report_type': 'Periodic Transaction Report'
-        }
+        report = Report(
+            name='Direct URL Report',
+            office='Unknown',
+            report_type='Periodic Transaction Report',
+            date_filed='Unknown',
+            link=url
+        )
         
         # Process the report using the existing method
-        result = self.process_report(report_data)
+        result = self.process_report(asdict(report))
         
         if result:
             # Extract the actual name from the report content if available
             if 'transactions' in result and result['transactions']:
                 # Try to get the name from the first transaction
                 first_transaction = result['transactions'][0]
-                if 'owner' in first_transaction:
+                if first_transaction.get('owner'):
                     result['name'] = f"Direct URL Report ({first_transaction['owner']})"
             
             # Save the result
             filename = f"direct_url_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
             filepath = self.raw_dir / filename
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2)
+            _write_json(filepath, result)
             
             logger.info(f"Successfully processed direct URL report: {url}")
             return result
@@ -160,6 +230,98 @@ class EnhancedSenateScraperWithDirectURL(extractor):
             logger.error(f"Failed to process direct URL report: {url}")
             return None
     
+    def search_payload(self, start_date, end_date, start=0):
+        """Build the form data the search page DataTable posts"""
+        # Format dates for the API
+        start_date_api = f"{start_date} 00:00:00"
+        end_date_api = f"{end_date} 23:59:59"
+        
+        return {
+            "start": start,
+            "length": _SEARCH_PAGE_SIZE,
+            "csrfmiddlewaretoken": self.session.cookies.get("csrftoken", ""),
+            # Periodic Transaction Reports filed by senators
+            "report_types": f"[{_PTR_REPORT_TYPE}]",
+            "filer_types": "[1]",
+            "submitted_start_date": start_date_api,
+            "submitted_end_date": end_date_api,
+            "candidate_state": "",
+            "senator_state": "",
+            "office_id": "",
+            "first_name": "",
+            "last_name": ""
+        }
+    
+    def search_headers(self):
+        """Headers the search page sends with its DataTable requests"""
+        return {
+            "X-Requested-With": "XMLHttpRequest",
+            "Referer": f"{self.base_url}/search/"
+        }
+    
+    def search_api(self, start_date, end_date, start=0):
+        """POST the same AJAX request that the search page DataTable makes"""
+        return self.session.post(
+            f"{self.base_url}/search/report/data/",
+            data=self.search_payload(start_date, end_date, start),
+            headers=self.search_headers()
+        )
+    
+    def search_api_records(self, start_date, end_date):
+        """Fetch every page of search results, or None if the API refuses the request"""
+        records = []
+        while True:
+            response = self.search_api(start_date, end_date, start=len(records))
+            if response.status_code != 200:
+                logger.warning(f"Search API returned status {response.status_code}")
+                return None
+            
+            data = _loads(response.content)
+            page = data.get('data', [])
+            records.extend(page)
+            if len(page) < _SEARCH_PAGE_SIZE or len(records) >= data.get('recordsFiltered', data.get('recordsTotal', 0)):
+                return records
+    
+    def extract_link(self, link_html):
+        """Extract the absolute report link from a DataTable cell"""
+        match = _HREF_RE.search(link_html)
+        if match:
+            return f"{self.base_url}{match.group(1)}"
+        
+        # Fall back to a real parser if the markup doesn't match the expected shape
+        link_elem = BeautifulSoup(link_html, 'lxml').find('a')
+        if link_elem and 'href' in link_elem.attrs:
+            return f"{self.base_url}{link_elem['href']}"
+        
+        return None
+    
+    def extract_link_text(self, link_html):
+        """Extract the anchor text, i.e. the report type, from a DataTable cell"""
+        match = _ANCHOR_TEXT_RE.search(link_html)
+        return unescape(match.group(1)).strip() if match else ''
+    
+    def parse_api_records(self, records):
+        """Convert rows returned by the search API into report dicts"""
+        reports = []
+        
+        for record in records:
+            # Columns: first name, last name, office, report link, date filed
+            link = None
+            if len(record) >= 5:
+                link = self.extract_link(record[3])
+            
+            if link:
+                report = Report(
+                    name=f"{record[0]} {record[1]}",  # First Name, Last Name
+                    office=record[2],  # Office (Filer Type)
+                    report_type=self.extract_link_text(record[3]),  # Report Type
+                    date_filed=record[4],  # Date Received/Filed
+                    link=link
+                )
+                reports.append(report)
+        
+        return reports
+    
     def search_reports(self, start_date, end_date):
         """Search for reports within date range"""
         logger.info(f"Searching for reports from {start_date} to {end_date}")
@@ -169,80 +331,82 @@ class EnhancedSenateScraperWithDirectURL(extractor):
             logger.error("Failed to establish session")
             return []
         
+        # Go straight to the DataTables endpoint - the session already carries the agreement cookies
+        try:
+            records = self.search_api_records(start_date, end_date)
+            if records is not None:
+                reports = self.parse_api_records(records)
+                if reports or not records:
+                    logger.info(f"Found {len(reports)} reports")
+                    return reports
+                logger.warning(f"None of the {len(records)} search API rows could be parsed, falling back to Selenium search")
+            else:
+                logger.warning("Search API request was refused, falling back to Selenium search")
+        except Exception as e:
+            logger.warning(f"Search API request failed, falling back to Selenium search: {e}")
+        
+        return self.search_reports_selenium(start_date, end_date)
+    
+    def debug_dumps_enabled(self):
+        """Whether to write debug screenshots and page dumps to disk"""
+        return bool(os.environ.get("SATORI_DEBUG")) or logger.isEnabledFor(logging.DEBUG)
+    
+    def wait_for_ajax(self, timeout=15):
+        """Wait until the page has no jQuery AJAX requests in flight"""
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                lambda d: d.execute_script("return window.jQuery ? jQuery.active == 0 : true")
+            )
+        except Exception as e:
+            logger.warning(f"Timed out waiting for AJAX requests to finish: {e}")
+    
+    def search_reports_selenium(self, start_date, end_date):
+        """Search for reports by driving the search form in the browser"""
+        # The agreement may have been accepted over requests, so hand the browser its cookies
+        self._sync_cookies(self.driver)
+        
         # Navigate to search page (in case we're not already there)
         self.driver.get(f"{self.base_url}/search/")
-        time.sleep(3)
         
         # Select report type (Periodic Transaction Report)
         try:
             ptr_checkbox = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.XPATH, "//input[@value='7' and @name='report_type']"))
+                EC.element_to_be_clickable(_PTR_CHECKBOX)
             )
-            ptr_checkbox.click()
+            if not ptr_checkbox.is_selected():
+                ptr_checkbox.click()
             logger.info("Selected Periodic Transaction Report checkbox")
-            time.sleep(3)  # Longer wait after selecting report type to ensure date fields load
+            
+            # The form starts with Annual reports checked, which would mix them into the results
+            for annual_checkbox in self.driver.find_elements(*_ANNUAL_CHECKBOX):
+                if annual_checkbox.is_selected():
+                    annual_checkbox.click()
+            self.wait_for_ajax()  # Let the date fields finish loading
         except Exception as e:
             logger.error(f"Failed to select report type: {e}")
             return []
         
-        # Set date range with multiple strategies and explicit waits
+        # Set date range - one selector covers both the name and id variants of each field
         date_fields_found = False
-        
-        # Strategy 1: Try by name attribute with explicit wait
         try:
-            logger.info("Trying to find date fields by name attribute with explicit wait")
-            from_date = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.NAME, "fromDate"))
+            from_date = WebDriverWait(self.driver, 15).until(
+                EC.presence_of_element_located(_FROM_DATE)
             )
-            to_date = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.NAME, "toDate"))
-            )
-            logger.info("Found date fields by name attribute")
+            to_date = self.driver.find_element(*_TO_DATE)
             date_fields_found = True
         except Exception as e:
-            logger.warning(f"Could not find date fields by name: {e}")
-        
-        # Strategy 2: Try by ID attribute if name fails
-        if not date_fields_found:
-            try:
-                logger.info("Trying to find date fields by ID attribute")
-                from_date = WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.ID, "fromDate"))
-                )
-                to_date = WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.ID, "toDate"))
-                )
-                logger.info("Found date fields by ID attribute")
-                date_fields_found = True
-            except Exception as e:
-                logger.warning(f"Could not find date fields by ID: {e}")
-        
-        # Strategy 3: Try by CSS selector if others fail
-        if not date_fields_found:
-            try:
-                logger.info("Trying to find date fields by CSS selector")
-                from_date = WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "input[name*='from'], input[id*='from']"))
-                )
-                to_date = WebDriverWait(self.driver, 10).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "input[name*='to'], input[id*='to']"))
-                )
-                logger.info("Found date fields by CSS selector")
-                date_fields_found = True
-            except Exception as e:
-                logger.warning(f"Could not find date fields by CSS selector: {e}")
+            logger.warning(f"Could not find date fields: {e}")
         
         # If we found the date fields, set the values
         if date_fields_found:
             try:
-                # Clear and set the dates using JavaScript for better reliability
+                # Set and read back the dates using JavaScript in a single round trip
                 logger.info("Setting date values using JavaScript")
-                self.driver.execute_script(f"document.getElementById('fromDate').value = '{start_date}';")
-                self.driver.execute_script(f"document.getElementById('toDate').value = '{end_date}';")
-                
-                # Verify the dates were set correctly
-                actual_from_date = self.driver.execute_script("return document.getElementById('fromDate').value;")
-                actual_to_date = self.driver.execute_script("return document.getElementById('toDate').value;")
+                actual_from_date, actual_to_date = self.driver.execute_script(
+                    "arguments[0].value = arguments[2]; arguments[1].value = arguments[3];"
+                    "return [arguments[0].value, arguments[1].value];",
+                    from_date, to_date, start_date, end_date
+                )
                 
                 logger.info(f"Set date range from {actual_from_date} to {actual_to_date}")
                 
@@ -253,28 +417,27 @@ class EnhancedSenateScraperWithDirectURL(extractor):
                     from_date.send_keys(start_date)
                     to_date.clear()
                     to_date.send_keys(end_date)
-                
-                # Wait a moment after setting dates
-                time.sleep(2)
             except Exception as e:
                 logger.error(f"Failed to set date range: {e}")
                 return []
         else:
-            # If we couldn't find the date fields with any strategy, take a screenshot for debugging
+            # If we couldn't find the date fields, save debug files
             try:
-                screenshot_path = f"C:\\EMPIRE\\SATORI_Scraper\\date_fields_error_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-                self.driver.save_screenshot(screenshot_path)
-                logger.info(f"Saved screenshot to {screenshot_path}")
+                ts = datetime.now().strftime('%Y%m%d_%H%M%S')
+                if self.debug_dumps_enabled():
+                    screenshot_path = f"C:\\EMPIRE\\SATORI_Scraper\\date_fields_error_{ts}.png"
+                    self.driver.save_screenshot(screenshot_path)
+                    logger.info(f"Saved screenshot to {screenshot_path}")
                 
                 # Save HTML for debugging
-                html_path = f"C:\\EMPIRE\\SATORI_Scraper\\date_fields_error_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
+                html_path = f"C:\\EMPIRE\\SATORI_Scraper\\date_fields_error_{ts}.html"
                 with open(html_path, "w", encoding="utf-8") as f:
                     f.write(self.driver.page_source)
                 logger.info(f"Saved HTML to {html_path}")
             except Exception as e:
                 logger.error(f"Failed to save debug files: {e}")
             
-            logger.error("Could not find date fields with any strategy")
+            logger.error("Could not find date fields")
             return []
         
         # Submit search with explicit wait
@@ -287,7 +450,7 @@ class EnhancedSenateScraperWithDirectURL(extractor):
             # Approach 1: Look for button with exact text "Search Reports"
             try:
                 search_button = WebDriverWait(self.driver, 10).until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Search Reports')]"))
+                    EC.element_to_be_clickable(_SEARCH_BTN_TEXT)
                 )
                 logger.info("Found 'Search Reports' button by text")
             except:
@@ -297,7 +460,7 @@ class EnhancedSenateScraperWithDirectURL(extractor):
             if not search_button:
                 try:
                     search_button = WebDriverWait(self.driver, 10).until(
-                        EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Search')]"))
+                        EC.element_to_be_clickable(_SEARCH_BTN_PARTIAL_TEXT)
                     )
                     logger.info("Found button containing 'Search' text")
                 except:
@@ -307,7 +470,7 @@ class EnhancedSenateScraperWithDirectURL(extractor):
             if not search_button:
                 try:
                     search_button = WebDriverWait(self.driver, 10).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, "button.btn-primary, button[type='submit']"))
+                        EC.element_to_be_clickable(_SEARCH_BTN)
                     )
                     logger.info("Found button by CSS class or type")
                 except:
@@ -319,7 +482,6 @@ class EnhancedSenateScraperWithDirectURL(extractor):
                 try:
                     # Scroll to the button
                     self.driver.execute_script("arguments[0].scrollIntoView(true);", search_button)
-                    time.sleep(1)
                     
                     # Try regular click
                     search_button.click()
@@ -339,16 +501,15 @@ class EnhancedSenateScraperWithDirectURL(extractor):
                 
             # Wait for results page to load
             logger.info("Waiting for results page to load")
-            time.sleep(5)  # Initial wait
             
-            # Then wait for the results table to appear
+            # Wait for the results table to appear
             WebDriverWait(self.driver, 30).until(
-                EC.presence_of_element_located((By.CLASS_NAME, "table"))
+                EC.presence_of_element_located(_RESULTS_TABLE)
             )
             logger.info("Results page loaded successfully")
             
-            # Additional wait to ensure all content is loaded
-            time.sleep(3)
+            # Wait for the DataTable requests to finish
+            self.wait_for_ajax()
             
         except Exception as e:
             logger.error(f"Error in search button process: {e}")
@@ -363,34 +524,38 @@ class EnhancedSenateScraperWithDirectURL(extractor):
         """Extract report links using a method that handles dynamic DataTable loading"""
         reports = []
         
-        # Save HTML for debugging
-        try:
-            html_path = f"C:\\EMPIRE\\SATORI_Scraper\\results_page_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-            with open(html_path, "w", encoding="utf-8") as f:
-                f.write(self.driver.page_source)
-            logger.info(f"Saved results page HTML to {html_path}")
-        except Exception as e:
-            logger.error(f"Failed to save HTML: {e}")
-        
         # Wait for the DataTable to finish loading
         logger.info("Waiting for DataTable to finish loading...")
         
         # Check if the "Processing" indicator is visible and wait for it to disappear
         try:
             processing_indicator = WebDriverWait(self.driver, 5).until(
-                EC.presence_of_element_located((By.ID, "filedReports_processing"))
+                EC.presence_of_element_located(_PROCESSING_INDICATOR)
             )
             
             # Wait for the processing indicator to disappear
             WebDriverWait(self.driver, 30).until(
-                EC.invisibility_of_element_located((By.ID, "filedReports_processing"))
+                EC.invisibility_of_element_located(_PROCESSING_INDICATOR)
             )
             logger.info("DataTables processing completed")
         except Exception as e:
             logger.warning(f"Could not find or wait for processing indicator: {e}")
         
-        # Additional wait to ensure data is loaded
-        time.sleep(3)
+        # Make sure no DataTable requests are still in flight
+        self.wait_for_ajax()
+        
+        # Serialize the loaded DOM once and reuse it below
+        page_html = self.driver.page_source
+        
+        # Save HTML for debugging
+        if self.debug_dumps_enabled():
+            try:
+                html_path = f"C:\\EMPIRE\\SATORI_Scraper\\results_page_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
+                with open(html_path, "w", encoding="utf-8") as f:
+                    f.write(page_html)
+                logger.debug(f"Saved results page HTML to {html_path}")
+            except Exception as e:
+                logger.error(f"Failed to save HTML: {e}")
         
         # Try multiple strategies to extract the data
         
@@ -400,36 +565,21 @@ class EnhancedSenateScraperWithDirectURL(extractor):
             
             # Execute JavaScript to get the DataTable data
             js_script = """
-            var table = #filedReports.DataTable();
-            var data = table.data().toArray();
-            return JSON.stringify(data);
+            try {
+                var table = $('#filedReports').DataTable();
+                return JSON.stringify(table.data().toArray());
+            } catch (e) {
+                return "[]";
+            }
             """
             
             data_json = self.driver.execute_script(js_script)
-            data = json.loads(data_json)
+            data = _loads(data_json)
             
             logger.info(f"JavaScript extraction returned {len(data)} records")
             
-            # Process the data from the DataTable
-            for record in data:
-                # Extract the report link
-                link = None
-                if len(record) >= 5:  # Assuming the link is in the 4th column (index 3)
-                    link_html = record[3]
-                    soup = BeautifulSoup(link_html, 'html.parser')
-                    link_elem = soup.find('a')
-                    if link_elem and 'href' in link_elem.attrs:
-                        link = f"{self.base_url}{link_elem['href']}"
-                
-                if link:
-                    report = {
-                        'name': f"{record[1]} {record[0]}",  # First Name, Last Name
-                        'office': record[2],  # Office (Filer Type)
-                        'report_type': record[3].strip(),  # Report Type
-                        'date_filed': record[4],  # Date Received/Filed
-                        'link': link
-                    }
-                    reports.append(report)
+            # The DataTable holds the same rows the search API returns
+            reports = self.parse_api_records(data)
             
             if reports:
                 logger.info(f"Successfully extracted {len(reports)} reports using JavaScript extraction")
@@ -441,81 +591,60 @@ class EnhancedSenateScraperWithDirectURL(extractor):
         try:
             logger.info("Trying direct API approach...")
             
-            # Format dates for the API
-            start_date_api = f"{start_date} 00:00:00"
-            end_date_api = f"{end_date} 23:59:59"
-            
             # Make the same AJAX request that the DataTable makes
-            response = self.session.post(
-                f"{self.base_url}/search/report/data/",
-                data={
-                    "report_types": "[7]",
-                    "filer_types": "[]",
-                    "submitted_start_date": start_date_api,
-                    "submitted_end_date": end_date_api,
-                    "candidate_state": "",
-                    "senator_state": "",
-                    "office_id": "",
-                    "first_name": "",
-                    "last_name": ""
-                }
-            )
+            records = self.search_api_records(start_date, end_date)
             
-            if response.status_code == 200:
-                data = response.json()
-                logger.info(f"API response received with {len(data.get('data', []))} records")
+            if records is not None:
+                logger.info(f"API response received with {len(records)} records")
                 
                 # Process the data from the API response
-                for record in data.get('data', []):
-                    # Extract the report link
-                    link = None
-                    if len(record) >= 5:  # Assuming the link is in the 5th column (index 4)
-                        link_html = record[4]
-                        soup = BeautifulSoup(link_html, 'html.parser')
-                        link_elem = soup.find('a')
-                        if link_elem and 'href' in link_elem.attrs:
-                            link = f"{self.base_url}{link_elem['href']}"
-                    
-                    if link:
-                        report = {
-                            'name': f"{record[1]} {record[0]}",  # Last Name, First Name
-                            'office': record[2],  # Office (Filer Type)
-                            'report_type': record[3],  # Report Type
-                            'date_filed': record[5],  # Date Received/Filed
-                            'link': link
-                        }
-                        reports.append(report)
+                reports = self.parse_api_records(records)
                 
                 if reports:
                     logger.info(f"Successfully extracted {len(reports)} reports using API approach")
                     return reports
-            else:
-                logger.warning(f"API request failed with status {response.status_code}")
         except Exception as e:
             logger.warning(f"API approach failed: {e}")
         
         # Strategy 3: Parse the loaded table
         try:
             logger.info("Trying to parse the loaded table...")
+            base = self.base_url
             
-            # Re-parse the page after the data has been loaded
-            soup = BeautifulSoup(self.driver.page_source, 'html.parser')
+            # Result rows follow a fixed template, so scan the raw HTML first
+            for match in _ROW_RE.finditer(page_html):
+                first_name, last_name, office, href, report_type, date_filed = (
+                    unescape(group.strip()) for group in match.groups()
+                )
+                reports.append(Report(
+                    name=f"{first_name} {last_name}",
+                    office=office,
+                    report_type=report_type,
+                    date_filed=date_filed,
+                    link=f"{base}{href}"
+                ))
+            
+            if reports:
+                logger.info(f"Successfully extracted {len(reports)} reports by scanning the table")
+                return reports
+            
+            # The template didn't match - parse the page as captured after the data was loaded
+            doc = lxml.html.fromstring(page_html)
             
             # Find the results table
-            table = soup.find('table', id='filedReports')
-            if not table:
+            tables = doc.xpath('//table[@id="filedReports"]')
+            if not tables:
                 logger.error("Table with id 'filedReports' not found")
                 return reports
+            table = tables[0]
             
             # Find all rows in the table body
-            tbody = table.find('tbody')
-            if tbody:
-                rows = tbody.find_all('tr')
-            else:
-                rows = table.find_all('tr')[1:]  # Skip header row if no tbody
+            rows = table.xpath('./tbody/tr')
+            if not rows:
+                rows = table.xpath('.//tr')[1:]  # Skip header row if no tbody
             
             # Skip the "No matching reports" row
-            if rows and len(rows) == 1 and "no matching filed reports" in rows[0].get_text(strip=True).lower():
+            if rows and len(rows) == 1 and "no matching filed reports" in rows[0].text_content().strip().lower():
                 logger.info("No reports found for the specified date range")
                 return reports
             
@@ -523,40 +652,41 @@ class EnhancedSenateScraperWithDirectURL(extractor):
             
             for i, row in enumerate(rows):
                 try:
-                    cells = row.find_all(['td', 'th'])
+                    cells = row.xpath('./td')
                     if len(cells) >= 5:  # We expect 5 cells: First Name, Last Name, Office, Report Type, Date
                         # Extract name from first two cells
-                        first_name = cells[0].get_text(strip=True)
-                        last_name = cells[1].get_text(strip=True)
+                        first_name = cells[0].text_content().strip()
+                        last_name = cells[1].text_content().strip()
                         name = f"{first_name} {last_name}"
                         
                         # Extract office
-                        office = cells[2].get_text(strip=True)
+                        office = cells[2].text_content().strip()
                         
-                        # The link is in the 4th cell (index 3) - Report Type
-                        report_type_cell = cells[3]
-                        link_elem = report_type_cell.find('a')
+                        # The link is in the 4th cell - Report Type
+                        link_elems = row.xpath('./td[4]/a[@href]')
                         
-                        if link_elem and 'href' in link_elem.attrs:
+                        if link_elems:
+                            link_elem = link_elems[0]
+                            
                             # Extract report type from the link text
-                            report_type = link_elem.get_text(strip=True)
+                            report_type = link_elem.text_content().strip()
                             
                             # Extract date filed from the 5th cell (index 4)
-                            date_filed = cells[4].get_text(strip=True)
+                            date_filed = cells[4].text_content().strip()
                             
-                            report = {
-                                'name': name,
-                                'office': office,
-                                'report_type': report_type,
-                                'date_filed': date_filed,
-                                'link': self.base_url + link_elem['href']
-                            }
+                            report = Report(
+                                name=name,
+                                office=office,
+                                report_type=report_type,
+                                date_filed=date_filed,
+                                link=f"{base}{link_elem.get('href')}"
+                            )
                             reports.append(report)
-                            logger.debug(f"Added report: {report['name']} - {report['report_type']}")
+                            logger.debug(f"Added report: {report.name} - {report.report_type}")
                         else:
-                            logger.warning(f"No link found in report type cell for row {i}")
+                            logger.debug(f"No link found in report type cell for row {i}")
                     else:
-                        logger.warning(f"Row {i} has only {len(cells)} cells, expected at least 5")
+                        logger.debug(f"Row {i} has only {len(cells)} cells, expected at least 5")
                 except Exception as e:
                     logger.error(f"Error parsing row {i}: {e}")
             
@@ -569,6 +699,34 @@ class EnhancedSenateScraperWithDirectURL(extractor):
         logger.info(f"Found {len(reports)} reports total")
         return reports
     
+    def is_done(self, result):
+        """Whether a saved result needs no retry on later runs"""
+        return bool(result.get('extraction_success') or result.get('paper_filing'))
+    
+    def load_processed_urls(self):
+        """Collect the links of every report already saved under raw_dir, skipping failed extractions"""
+        for filepath in self.raw_dir.rglob("*.json"):
+            if filepath.name == "summary.json":
+                continue
+            try:
+                result = _loads(filepath.read_bytes())
+            except Exception as e:
+                logger.warning(f"Could not read {filepath}: {e}")
+                continue
+            if result.get('link') and self.is_done(result):
+                self.processed_urls.add(result['link'])
+        
+        logger.info(f"Found {len(self.processed_urls)} previously processed reports")
+    
+    def process_report_rate_limited(self, report, html_content=None):
+        """Process a single report, waiting for the rate limiter if it still has to be downloaded
+        
+        Prefetched pages already went through the same limiter in download_reports.
+        """
+        if html_content is None:
+            self.rate_limiter.acquire()
+        return self.process_report(asdict(report), html_content)
+    
     def process_reports(self, reports, batch_name):
         """Process a list of reports"""
         logger.info(f"Processing {len(reports)} reports for batch {batch_name}")
@@ -579,45 +737,145 @@ class EnhancedSenateScraperWithDirectURL(extractor):
         
         processed_reports = []
         
-        for i, report in enumerate(reports):
-            logger.info(f"Processing report {i+1}/{len(reports)}: {report['name']}")
-            
-            # Process the report using the existing method
-            result = self.process_report(report)
-            
-            if result:
-                # Save the result
-                filename = f"{report['name'].replace(' ', '_').replace(',', '')}.json"
-                filepath = batch_dir / filename
-                
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    json.dump(result, f, indent=2)
+        # Skip reports that an earlier run already saved
+        pending = [report for report in reports if report.link not in self.processed_urls]
+        skipped = len(reports) - len(pending)
+        if skipped:
+            logger.info(f"Skipping {skipped} already processed reports")
+        
+        # Fetch the report pages concurrently; anything missing falls back to the browser
+        pages = self.download_reports([report.link for report in pending]) if pending else {}
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self.process_report_rate_limited, report, pages.get(report.link)): report
+                for report in pending
+            }
+            
+            # Save each result as soon as its report finishes
+            for i, future in enumerate(as_completed(futures)):
+                report = futures[future]
+                logger.info(f"Finished report {i+1}/{len(pending)}: {report.name}")
                 
-                processed_reports.append(result)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Error processing report {report.name}: {e}")
+                    result = None
                 
-                # Log summary
-                logger.info(f"Extracted {result['transaction_count']} transactions")
-            else:
-                logger.error(f"Failed to process report: {report['name']}")
-            
-            # Rate limiting
-            time.sleep(1)
+                if result:
+                    # Save the result - the report id keeps one filer's reports apart
+                    report_id = report.link.rstrip('/').rsplit('/', 1)[-1]
+                    filename = f"{report.name.translate(_FNAME_TABLE)}_{report_id}.json"
+                    filepath = batch_dir / filename
+                    
+                    _write_json(filepath, result)
+                    # Failed extractions are saved too, but retried on the next run
+                    if self.is_done(result):
+                        self.processed_urls.add(report.link)
+                    
+                    # Keep only a lightweight record; the full result is already on disk
+                    processed_reports.append({
+                        'name': result['name'],
+                        'filepath': str(filepath),
+                        'transaction_count': result['transaction_count'],
+                        'paper_filing': bool(result.get('paper_filing'))
+                    })
+                    
+                    # Log summary
+                    if not result.get('paper_filing'):
+                        logger.info(f"Extracted {result['transaction_count']} transactions")
+                else:
+                    logger.error(f"Failed to process report: {report.name}")
+        
+        # Save batch summary, keeping the reports saved by earlier runs of this batch
+        summary_file = batch_dir / "summary.json"
+        saved_reports = {}
+        if summary_file.exists():
+            try:
+                for entry in _loads(summary_file.read_bytes()).get('reports', []):
+                    saved_reports[entry['filepath']] = entry
+            except Exception as e:
+                logger.warning(f"Could not read {summary_file}: {e}")
+        for entry in processed_reports:
+            saved_reports[entry['filepath']] = entry
+        all_reports = list(saved_reports.values())
         
-        # Save batch summary
         summary = {
             'batch_name': batch_name,
             'processing_date': datetime.now().isoformat(),
             'total_reports': len(reports),
-            'successful_reports': len(processed_reports),
-            'total_transactions': sum(r['transaction_count'] for r in processed_reports),
-            'reports': processed_reports
+            'skipped_reports': skipped,
+            'successful_reports': len(all_reports),
+            'paper_filings': sum(1 for r in all_reports if r.get('paper_filing')),
+            'total_transactions': sum(r['transaction_count'] for r in all_reports),
+            'reports': all_reports
         }
         
-        summary_file = batch_dir / "summary.json"
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2)
+        _write_json(summary_file, summary)
+        
+        logger.info(f"Batch {batch_name} completed: {len(processed_reports)}/{len(pending)} reports processed")
+    
+    def month_date_range(self, year, month):
+        """Return the search start and end dates covering a month"""
+        # Format dates for Senate search (MM/DD/YYYY, as in run_daily_scrape)
+        last_day = calendar.monthrange(year, month)[1]
+        start_date = f"{month:02d}/01/{year}"
+        end_date = f"{month:02d}/{last_day:02d}/{year}"
+        
+        return start_date, end_date
+    
+    async def search_month(self, session, semaphore, year, month):
+        """Search one month through the DataTables endpoint, returning None on failure"""
+        start_date, end_date = self.month_date_range(year, month)
+        
+        async with semaphore:
+            logger.info(f"Searching {year}-{month:02d}")
+            try:
+                records = []
+                while True:
+                    async with session.post(
+                        f"{self.base_url}/search/report/data/",
+                        data=self.search_payload(start_date, end_date, start=len(records)),
+                        headers=self.search_headers()
+                    ) as response:
+                        if response.status != 200:
+                            logger.warning(f"Search API returned status {response.status} for {year}-{month:02d}")
+                            return None
+                        data = _loads(await response.read())
+                    
+                    page = data.get('data', [])
+                    records.extend(page)
+                    if len(page) < _SEARCH_PAGE_SIZE or len(records) >= data.get('recordsFiltered', data.get('recordsTotal', 0)):
+                        break
+                
+                reports = self.parse_api_records(records)
+                if records and not reports:
+                    logger.warning(f"None of the {len(records)} search API rows for {year}-{month:02d} could be parsed")
+                    return None
+                logger.info(f"Found {len(reports)} reports for {year}-{month:02d}")
+                return reports
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+                logger.warning(f"Search API request failed for {year}-{month:02d}: {e}")
+            finally:
+                # Rate limiting - be respectful to the server
+                await asyncio.sleep(2)
         
-        logger.info(f"Batch {batch_name} completed: {len(processed_reports)}/{len(reports)} reports processed")
+        return None
+    
+    async def search_months(self, months):
+        """Search all months concurrently, bounded by max_concurrent_searches"""
+        semaphore = asyncio.Semaphore(self.max_concurrent_searches)
+        
+        # Reuse the cookies from the established session so the agreement carries over
+        async with aiohttp.ClientSession(
+            cookies=self.session.cookies.get_dict(),
+            headers=dict(self.session.headers),
+            timeout=aiohttp.ClientTimeout(total=60)
+        ) as session:
+            return await asyncio.gather(
+                *(self.search_month(session, semaphore, year, month) for year, month in months)
+            )
     
     def run_historical_scrape(self, start_year=2018, end_year=None):
         """Scrape historical data from start_year to end_year"""
@@ -631,35 +889,32 @@ class EnhancedSenateScraperWithDirectURL(extractor):
             logger.error("Failed to establish session")
             return False
         
-        # Iterate through years
-        for year in range(start_year, end_year + 1):
-            logger.info(f"Processing year: {year}")
+        # Don't redo reports saved by an earlier, possibly interrupted, run
+        self.load_processed_urls()
+        
+        # Collect every month in range, skipping future months
+        current_month = datetime.now().month
+        months = [
+            (year, month)
+            for year in range(start_year, end_year + 1)
+            for month in range(1, 13)
+            if not (year == end_year and month > current_month)
+        ]
+        
+        # Search all months concurrently
+        results = asyncio.run(self.search_months(months))
+        
+        # Process each month's reports
+        for (year, month), reports in zip(months, results):
+            logger.info(f"Processing {year}-{month:02d}")
             
-            # Iterate through months
-            for month in range(1, 13):
-                # Skip future months
-                if year == end_year and month > datetime.now().month:
-                    continue
-                
-                logger.info(f"Processing {year}-{month:02d}")
-                
-                # Format dates for Senate search
-                start_date = f"01/{month:02d}/{year}"
-                
-                # Calculate end date (last day of month)
-                if month == 12:
-                    end_date = f"31/12/{year}"
-                else:
-                    end_date = f"30/{month+1:02d}/{year}"
-                
-                # Get reports for this month
+            # Months the concurrent search could not fetch go through the regular search path
+            if reports is None:
+                start_date, end_date = self.month_date_range(year, month)
                 reports = self.search_reports(start_date, end_date)
-                
-                if reports:
-                    self.process_reports(reports, f"{year}-{month:02d}")
-                
-                # Rate limiting - be respectful to the server
-                time.sleep(2)
+            
+            if reports:
+                self.process_reports(reports, f"{year}-{month:02d}")
         
         logger.info("Historical scrape completed")
         return True
@@ -673,6 +928,9 @@ class EnhancedSenateScraperWithDirectURL(extractor):
             logger.error("Failed to establish session")
             return False
         
+        # Don't redo reports saved by an earlier run
+        self.load_processed_urls()
+        
         # Get today and yesterday dates
         today = datetime.now()
         yesterday = today - timedelta(days=1)
@@ -746,4 +1004,4 @@ def main():
         scraper.close()
 
 if __name__ == "__main__":
-    main()
+    main()
@@ -1,17 +1,33 @@
 # Enhanced version of robust_senate_extractor.py with improved error handling
+import asyncio
+import functools
+import gzip
+import hashlib
 import json
 import os
+import queue
 import time
 import re
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from io import BytesIO
 from pathlib import Path
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
+import aiohttp
 import requests
-from urllib.parse import urljoin
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urljoin, urlparse
 import logging
 from datetime import datetime
 
@@ -26,100 +42,411 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Ticker patterns: (AAPL) or [AAPL], AAPL -, - AAPL
+_TICKER_PAREN = re.compile(r'[(\[]([A-Z]{1,5})[)\]]')
+_TICKER_DASH_R = re.compile(r'([A-Z]{1,5})\s*-')
+_TICKER_DASH_L = re.compile(r'-\s*([A-Z]{1,5})')
+
+# Transaction-like text blocks for the regex fallback
+_TX_PATTERN = re.compile(
+    r'([A-Za-z\s]+)\s*(Purchase|Sale|Exchange)\s*(\d{1,2}/\d{1,2}/\d{4})\s*(\$[\d,]+-\$[\d,]+|\$[\d,]+)',
+    re.IGNORECASE
+)
+
+# Characters in filer names that can't go into file names
+_NAME_TRANS = str.maketrans(' /\\:', '____')
+
+# Keywords that mark a block of text as a possible transaction
+_TXN_HINT = re.compile(r'purchase|sale|exchange|asset|security|\$|ticker', re.IGNORECASE)
+
+# Transaction types, any of which must appear before the regex fallback is worth running
+_TX_TYPE_HINT = re.compile(r'purchase|sale|exchange', re.IGNORECASE)
+
+# Components of a free-text transaction
+_TEXT_ASSET = re.compile(r'([A-Za-z\s]+(?:Inc|Corp|LLC|Ltd|ETF)?)')
+_TEXT_TYPE = re.compile(r'(Purchase|Sale|Exchange)', re.IGNORECASE)
+_TEXT_DATE = re.compile(r'(\d{1,2}/\d{1,2}/\d{4})')
+_TEXT_AMOUNT = re.compile(r'(\$[\d,]+-\$[\d,]+|\$[\d,]+)')
+
+# Owner keywords, one named group per relationship
+_OWNER_RE = re.compile(
+    r'(?P<spouse>spouse|husband|wife|joint|spousal)'
+    r'|(?P<child>child|son|daughter|dependent|minor)'
+    r'|(?P<family>family|trust|estate)',
+    re.IGNORECASE
+)
+
+# Possible header names for each transaction field
+_FIELD_MAPPINGS = {
+    'asset': ['asset', 'security', 'name', 'description'],
+    'transaction_type': ['transaction', 'type', 'action'],
+    'date': ['date', 'transaction date'],
+    'amount': ['amount', 'value'],
+    'owner': ['owner'],
+    'ticker': ['ticker', 'symbol']
+}
+
+@functools.lru_cache(maxsize=64)
+def _build_header_map(headers):
+    """Map each field to the index of the first matching header, cached per header row"""
+    header_map = []
+    for field, possible_names in _FIELD_MAPPINGS.items():
+        for idx, header in enumerate(headers):
+            if any(name in header for name in possible_names):
+                header_map.append((field, idx))
+                break
+    return tuple(header_map)
+
+@dataclass(slots=True)
+class Transaction:
+    """One transaction parsed from a report"""
+    asset: str = ''
+    transaction_type: str = ''
+    date: str = ''
+    amount: str = ''
+    owner: str = ''  # Empty unless the report names an owner
+    ticker: str | None = None
+    relationship: str | None = None  # Set along with owner
+    raw_text: str = ''
+    cell_count: int = 0
+
+def _clean_text(text):
+    """Collapse the whitespace runs that multi-line table cells contain"""
+    return ' '.join(text.split())
+
+def _is_binary(content_type):
+    """Whether a response is a scanned paper filing rather than an HTML report"""
+    return 'application/pdf' in content_type or 'image/' in content_type
+
+def _write_gz(path, text):
+    """Write text to a gzip-compressed file"""
+    try:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(path, 'wt', encoding='utf-8', compresslevel=6) as f:
+            f.write(text)
+    except Exception as e:
+        logger.warning(f"Failed to write {path}: {e}")
+
+class ReportCache:
+    """SQLite index of downloaded report pages, used to skip or revalidate repeat fetches"""
+    def __init__(self, cache_dir, ttl=7 * 24 * 3600):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self._conn = sqlite3.connect(str(self.cache_dir / "reports.sqlite3"), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS reports ("
+            "url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, html_path TEXT, fetched_at REAL)"
+        )
+        self._conn.commit()
+        self._db_lock = threading.Lock()
+        self._url_locks = {}
+        self._url_locks_guard = threading.Lock()
+    
+    def lock(self, url):
+        """Lock held while fetching a URL so concurrent callers share one upstream request"""
+        with self._url_locks_guard:
+            return self._url_locks.setdefault(url, threading.Lock())
+    
+    def _lookup(self, url):
+        with self._db_lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified, html_path, fetched_at FROM reports WHERE url = ?", (url,)
+            ).fetchone()
+        if row and Path(row[2]).exists():
+            return row
+        return None
+    
+    def load(self, url, fresh_only=False):
+        """Return the cached HTML for a URL, optionally only if it is within the TTL"""
+        entry = self._lookup(url)
+        if not entry:
+            return None
+        if fresh_only and time.time() - entry[3] > self.ttl:
+            return None
+        with gzip.open(entry[2], 'rt', encoding='utf-8') as f:
+            return f.read()
+    
+    def conditional_headers(self, url):
+        """Build If-None-Match/If-Modified-Since headers for a cached URL"""
+        entry = self._lookup(url)
+        headers = {}
+        if entry:
+            if entry[0]:
+                headers['If-None-Match'] = entry[0]
+            if entry[1]:
+                headers['If-Modified-Since'] = entry[1]
+        return headers
+    
+    def store(self, url, html_content, etag=None, last_modified=None):
+        """Save a freshly downloaded page and its validators"""
+        html_path = self.cache_dir / f"{hashlib.sha1(url.encode('utf-8')).hexdigest()}.html.gz"
+        with gzip.open(html_path, 'wt', encoding='utf-8', compresslevel=6) as f:
+            f.write(html_content)
+        with self._db_lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO reports VALUES (?, ?, ?, ?, ?)",
+                (url, etag, last_modified, str(html_path), time.time())
+            )
+            self._conn.commit()
+    
+    def touch(self, url):
+        """Mark a cached page as revalidated"""
+        with self._db_lock:
+            self._conn.execute("UPDATE reports SET fetched_at = ? WHERE url = ?", (time.time(), url))
+            self._conn.commit()
+    
+    def close(self):
+        with self._db_lock:
+            self._conn.close()
+
+class DriverPool:
+    """Pool of headless Chrome drivers shared by report downloads
+    
+    Drivers are started on first demand, up to size, and reused for the rest of the run.
+    """
+    def __init__(self, factory, size=2):
+        self.factory = factory
+        self.size = size
+        self._q = queue.Queue()
+        self._drivers = []
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Take an idle driver, starting a new one if the pool isn't full yet"""
+        try:
+            return self._q.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._drivers) < self.size:
+                driver = self.factory(len(self._drivers))
+                self._drivers.append(driver)
+                return driver
+        return self._q.get()
+    
+    def release(self, driver):
+        self._q.put(driver)
+    
+    def close(self):
+        with self._lock:
+            for driver in self._drivers:
+                try:
+                    driver.quit()
+                except Exception as e:
+                    logger.warning(f"Failed to quit pooled driver: {e}")
+            self._drivers = []
+
 class EnhancedSenateExtractor:
+    # Returned in place of HTML for scanned paper filings, which have nothing to parse
+    PAPER_FILING = object()
+    
     def __init__(self):
-        self.driver = None
+        self._driver = None
         self.session = requests.Session()
-        self.base_url = "https://efdsearch.senate.gov"
-        self.setup_driver()
         
+        # Keep connections alive and let urllib3 retry transient failures with backoff
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=['GET', 'POST']
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # Includes br when a brotli decoder is installed
+        self.session.headers.update({
+            'Connection': 'keep-alive',
+            'Accept-Encoding': requests.utils.DEFAULT_ACCEPT_ENCODING
+        })
+        
+        self.base_url = "https://efdsearch.senate.gov"
+        # Optional limiter with a blocking acquire(), applied to every concurrent report fetch
+        self.rate_limiter = None
+        # Filed reports don't change, so downloaded pages are cached and revalidated
+        self.cache = ReportCache(os.environ.get('SATORI_CACHE_DIR', 'data/cache/senate'))
+        # Reports larger than this are parsed row by row instead of as a whole tree
+        self.streaming_threshold = 5 * 1024 * 1024
+        # Raw HTML is compressed and written off the scraping threads
+        # Created by the first write, so subclasses can point it elsewhere
+        self.raw_dir = Path(os.environ.get('SATORI_RAW_DIR', 'data/raw/senate'))
+        self.profile_dir = Path(os.environ.get('SATORI_CHROME_PROFILE', 'data/chrome_profile')).resolve()
+        self._writer_executor = ThreadPoolExecutor(max_workers=2)
+        # The main driver handles the agreement and searches, one thread at a time.
+        # Chrome is only started the first time something actually needs it.
+        self.driver_lock = threading.Lock()
+        self._driver_start_lock = threading.Lock()
+        # Report pages that need a browser are loaded on pooled drivers
+        self.pool = DriverPool(self._new_pool_driver, size=int(os.environ.get('SATORI_DRIVER_POOL', '2')))
+        
+    @property
+    def driver(self):
+        """Main Chrome driver, started on first use"""
+        if self._driver is None:
+            with self._driver_start_lock:
+                if self._driver is None:
+                    self.setup_driver()
+        return self._driver
+    
     def setup_driver(self):
         """Setup Chrome driver with enhanced options"""
+        self._driver = self._new_driver(self.profile_dir)
+    
+    def _new_pool_driver(self, index):
+        """Start a pooled driver with its own profile and the current session cookies"""
+        driver = self._new_driver(self.profile_dir.with_name(f"{self.profile_dir.name}_pool_{index}"))
+        self._sync_cookies(driver)
+        return driver
+    
+    def _sync_cookies(self, driver):
+        """Copy the requests session cookies into a driver"""
+        try:
+            driver.get(f"{self.base_url}/")
+            for cookie in self.session.cookies:
+                driver.add_cookie({'name': cookie.name, 'value': cookie.value})
+        except Exception as e:
+            logger.warning(f"Failed to copy session cookies to driver: {e}")
+    
+    def _new_driver(self, profile_dir):
+        """Create a Chrome driver with enhanced options"""
         options = Options()
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--headless")
-        options.add_argument("--user-data-dir=C:\\EMPIRE\\SATORI_Scraper\\chrome_profile")
+        options.add_argument("--headless=new")
+        options.add_argument("--disable-gpu")
+        options.add_argument(f"--user-data-dir={profile_dir}")
         options.add_argument("--disable-blink-features=AutomationControlled")
         options.add_argument("--disable-extensions")
         options.add_argument("--disable-plugins")
-        options.add_argument("--disable-images")  # Speed up loading
-        options.add_argument("--disable-javascript")  # Try without JS for some cases
-        self.driver = webdriver.Chrome(options=options)
+        # Speed up loading - the scraper never reads images or styles
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.managed_default_content_settings.stylesheets": 2
+        })
+        driver = webdriver.Chrome(options=options)
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+        except Exception as e:
+            logger.warning(f"Could not enable CDP network domain: {e}")
+        return driver
         
     def establish_session(self):
         """Establish session with multiple fallback strategies"""
         logger.info("Establishing session with Senate website...")
+        search_url = f"{self.base_url}/search/"
         
-        # Strategy 1: Standard Selenium approach
+        # Strategy 1: Submit the agreement form directly
         try:
-            self.driver.get(f"{self.base_url}/search/")
-            time.sleep(2)
+            response = self.session.get(search_url)
+            if self._on_search_page(response):
+                logger.info("Agreement already accepted")
+                return True
             
-            # Accept agreement
-            agreement_checkbox = WebDriverWait(self.driver, 10).until(
-                EC.element_to_be_clickable((By.ID, "agree_statement"))
-            )
-            agreement_checkbox.click()
-            logger.info("Accepted agreement via Selenium")
-            
-            # Transfer cookies to requests session
-            for cookie in self.driver.get_cookies():
-                self.session.cookies.set(cookie['name'], cookie['value'])
-            
-            return True
+            soup = BeautifulSoup(response.text, 'lxml')
+            agreement_form = soup.find('form', {'id': 'agreement_form'})
+            if agreement_form:
+                csrf_input = agreement_form.find('input', {'name': 'csrfmiddlewaretoken'})
+                csrf_token = csrf_input['value'] if csrf_input else self.session.cookies.get('csrftoken', '')
+                response = self.session.post(
+                    urljoin(search_url, agreement_form.get('action') or ''),
+                    data={'csrfmiddlewaretoken': csrf_token, 'prohibition_agreement': '1'},
+                    headers={'Referer': search_url}
+                )
+                # A rejected agreement redirects back to the agreement page
+                if self._on_search_page(response):
+                    logger.info("Accepted agreement via requests")
+                    return True
         except Exception as e:
-            logger.warning(f"Selenium session establishment failed: {e}")
+            logger.warning(f"Requests session establishment failed: {e}")
         
-        # Strategy 2: Direct requests approach
+        # Strategy 2: Click through the agreement in the browser
         try:
-            logger.info("Trying direct requests approach...")
-            response = self.session.get(f"{self.base_url}/search/")
-            if "agree_statement" in response.text:
-                # Find agreement form and submit
-                soup = BeautifulSoup(response.text, 'html.parser')
-                agreement_form = soup.find('form', {'id': 'agreement_form'})
-                if agreement_form:
-                    action = agreement_form.get('action')
-                    if action:
-                        response = self.session.post(
-                            urljoin(self.base_url, action),
-                            data={'agree_statement': 'agree'}
-                        )
-                        if response.status_code == 200:
-                            logger.info("Accepted agreement via requests")
-                            return True
+            logger.info("Trying Selenium approach...")
+            with self.driver_lock:
+                self.driver.get(search_url)
+                
+                # Accept agreement
+                agreement_checkbox = WebDriverWait(self.driver, 10).until(
+                    EC.element_to_be_clickable((By.ID, "agree_statement"))
+                )
+                agreement_checkbox.click()
+                logger.info("Accepted agreement via Selenium")
+                
+                # Transfer cookies to requests session
+                for cookie in self.driver.get_cookies():
+                    self.session.cookies.set(cookie['name'], cookie['value'])
+            
+            return True
         except Exception as e:
-            logger.warning(f"Requests session establishment failed: {e}")
+            logger.warning(f"Selenium session establishment failed: {e}")
         
         return False
     
+    def _on_search_page(self, response):
+        """Whether a response is the search page itself, past the agreement and not an error page"""
+        return (response.status_code == 200
+                and urlparse(response.url).path == '/search/'
+                and "agree_statement" not in response.text)
+    
     def download_report_with_enhanced_retry(self, report_data, max_retries=5):
         """Download report with multiple fallback strategies"""
         url = report_data['link']
         name = report_data['name']
         
+        # Most report pages are static HTML, so try a plain request before the browser
+        with self.cache.lock(url):
+            html_content = self.cache.load(url, fresh_only=True)
+            if html_content is not None:
+                return html_content
+            
+            try:
+                with self.session.get(url, timeout=15, stream=True,
+                                      headers=self.cache.conditional_headers(url)) as response:
+                    # Paper filings have no transactions to parse, so don't download them
+                    if _is_binary(response.headers.get('Content-Type', '')):
+                        logger.info(f"Skipping {name}: report is a {response.headers['Content-Type']} document")
+                        return self.PAPER_FILING
+                    if response.status_code == 304:
+                        html_content = self.cache.load(url)
+                        if html_content is not None:
+                            self.cache.touch(url)
+                            return html_content
+                    elif response.status_code == 200 and not self.needs_browser(response.text):
+                        self.cache.store(url, response.text, response.headers.get('ETag'),
+                                         response.headers.get('Last-Modified'))
+                        return response.text
+                logger.info(f"Direct request for {name} needs the browser, falling back to Selenium")
+            except requests.RequestException as e:
+                logger.warning(f"Direct request failed for {name}: {e}")
+        
         for attempt in range(max_retries):
             try:
                 logger.info(f"Attempt {attempt + 1} for {name}")
                 
                 # Strategy 1: Selenium with full JS
                 if attempt < 3:
-                    self.driver.get(url)
-                    time.sleep(3)
-                    
-                    # Check for redirect
-                    if "eFD: Home" in self.driver.title:
-                        logger.info("Redirected to home, re-establishing session...")
-                        self.establish_session()
-                        self.driver.get(url)
-                        time.sleep(3)
-                        
-                        if "eFD: Home" in self.driver.title:
+                    driver = self.pool.acquire()
+                    try:
+                        title, html_content = self.load_page(driver, url)
+                        if html_content is None:
                             continue
-                    
-                    # Save HTML
-                    html_content = self.driver.page_source
+                        
+                        # Check for redirect
+                        if "eFD: Home" in title:
+                            logger.info("Redirected to home, re-establishing session...")
+                            self.establish_session()
+                            self._sync_cookies(driver)
+                            title, html_content = self.load_page(driver, url)
+                            
+                            if html_content is None or "eFD: Home" in title:
+                                continue
+                    finally:
+                        self.pool.release(driver)
                     return html_content
                 
                 # Strategy 2: Direct requests (for non-JS pages)
@@ -132,44 +459,181 @@ class EnhancedSenateExtractor:
                 
             except Exception as e:
                 logger.error(f"Error on attempt {attempt + 1}: {e}")
+        
+        return None
+    
+    def load_page(self, driver, url, timeout=10):
+        """Load a page over CDP and return its title and HTML, or (None, None) if it didn't load
+        
+        Page.navigate returns without WebDriver's page-load wait, so the new document is
+        detected by polling its timeOrigin and readyState. Falls back to driver.get.
+        """
+        try:
+            previous = self._evaluate(driver, 'performance.timeOrigin')
+            navigation = driver.execute_cdp_cmd('Page.navigate', {'url': url})
+        except Exception as e:
+            logger.warning(f"CDP navigation failed, using WebDriver: {e}")
+            driver.get(url)
+            self.wait_for_report(driver)
+            return driver.title, driver.page_source
+        
+        if navigation.get('errorText'):
+            logger.warning(f"Navigation to {url} failed: {navigation['errorText']}")
+            return None, None
+        
+        # Until the new document is ready the driver still shows the previous page
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            try:
+                state = self._evaluate(driver, '[performance.timeOrigin, document.readyState]')
+            except Exception as e:
+                # The old document can go away mid-poll
+                logger.debug(f"Polling {url} failed: {e}")
+                state = None
+            if state and state[0] != previous and state[1] != 'loading':
+                break
+            time.sleep(0.1)
+        else:
+            logger.warning(f"Timed out waiting for {url} to load")
+            return None, None
+        
+        try:
+            page = self._evaluate(driver, '({title: document.title, html: document.documentElement.outerHTML})')
+            return page['title'], page['html']
+        except Exception as e:
+            logger.warning(f"Could not read {url} from the browser: {e}")
+            return None, None
+    
+    def _evaluate(self, driver, expression):
+        """Evaluate a JS expression in the driver's current page over CDP"""
+        return driver.execute_cdp_cmd('Runtime.evaluate', {
+            'expression': expression, 'returnByValue': True
+        })['result'].get('value')
+    
+    def wait_for_report(self, driver=None, timeout=10):
+        """Wait until the report table renders or the site redirects to the home page"""
+        try:
+            WebDriverWait(driver or self.driver, timeout).until(EC.any_of(
+                EC.presence_of_element_located((By.TAG_NAME, "table")),
+                EC.title_contains("eFD: Home")
+            ))
+        except TimeoutException:
+            logger.warning("Timed out waiting for report table")
+    
+    def needs_browser(self, html_content):
+        """Check whether a fetched page must be loaded through Selenium instead"""
+        if not html_content or len(html_content) < 1024 or 'agree_statement' in html_content:
+            return True
+        return '<table' not in html_content and 'No transactions' not in html_content
+    
+    async def _fetch(self, url, session, sem, max_retries=3):
+        """Fetch one report page, retrying with exponential backoff"""
+        html_content = self.cache.load(url, fresh_only=True)
+        if html_content is not None:
+            return html_content
+        
+        async with sem:
+            for attempt in range(max_retries):
+                if self.rate_limiter is not None:
+                    await asyncio.to_thread(self.rate_limiter.acquire)
+                try:
+                    async with session.get(url, headers=self.cache.conditional_headers(url)) as response:
+                        if response.status == 304:
+                            html_content = self.cache.load(url)
+                            if html_content is not None:
+                                self.cache.touch(url)
+                                return html_content
+                        elif response.status == 200:
+                            if _is_binary(response.headers.get('Content-Type', '')):
+                                return self.PAPER_FILING
+                            html_content = await response.text()
+                            if not self.needs_browser(html_content):
+                                self.cache.store(url, html_content, response.headers.get('ETag'),
+                                                 response.headers.get('Last-Modified'))
+                            return html_content
+                        logger.warning(f"Fetching {url} failed with status {response.status}")
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    logger.warning(f"Error fetching {url} on attempt {attempt + 1}: {e}")
+                
                 if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
+                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
         
         return None
     
+    async def _fetch_all(self, urls, concurrency):
+        """Fetch all URLs over one pooled aiohttp session"""
+        sem = asyncio.Semaphore(concurrency)
+        connector = aiohttp.TCPConnector(limit_per_host=concurrency, keepalive_timeout=60)
+        
+        # Reuse the agreement cookies from the requests session
+        async with aiohttp.ClientSession(
+            connector=connector,
+            cookies=self.session.cookies.get_dict(),
+            headers=dict(self.session.headers),
+            timeout=aiohttp.ClientTimeout(total=30)
+        ) as session:
+            return await asyncio.gather(*(self._fetch(url, session, sem) for url in urls))
+    
+    def download_reports(self, urls, concurrency=8):
+        """Download report pages concurrently without a browser
+        
+        Returns a dict of URL to HTML, or PAPER_FILING for scanned filings. Pages that
+        failed or need Selenium are left out, so process_report falls back to
+        download_report_with_enhanced_retry.
+        """
+        urls = list(dict.fromkeys(urls))
+        pages = asyncio.run(self._fetch_all(urls, concurrency))
+        return {
+            url: html for url, html in zip(urls, pages)
+            if html is self.PAPER_FILING or not self.needs_browser(html)
+        }
+    
     def extract_transactions_with_fallback(self, html_content):
         """Extract transactions with multiple parsing strategies"""
         transactions = []
-        soup = BeautifulSoup(html_content, 'html.parser')
+        
+        # Pages this small are empty shells with nothing to extract
+        if len(html_content) < 2048:
+            return transactions
         
         # Strategy 1: Standard table parsing
-        transactions = self.parse_tables(soup)
+        try:
+            if len(html_content) > self.streaming_threshold:
+                transactions = self.parse_tables_streaming(html_content.encode('utf-8'))
+            else:
+                transactions = self.parse_tables(lxml.html.fromstring(html_content))
+        except Exception as e:
+            logger.warning(f"Could not parse report HTML: {e}")
         
         # Strategy 2: If no transactions found, try alternative parsing
         if not transactions:
             logger.info("Standard parsing failed, trying alternative methods...")
+            soup = BeautifulSoup(html_content, 'lxml')
             transactions = self.parse_alternative(soup)
         
         # Strategy 3: If still no transactions, try regex-based extraction
         if not transactions:
+            # Skip the regex pass on pages that can't contain a transaction
+            if not _TX_TYPE_HINT.search(html_content):
+                return transactions
             logger.info("Alternative parsing failed, trying regex extraction...")
             transactions = self.parse_with_regex(html_content)
         
         return transactions
     
-    def parse_tables(self, soup):
+    def parse_tables(self, doc):
         """Standard table parsing with enhanced header detection"""
         transactions = []
-        tables = soup.find_all('table')
+        tables = doc.xpath('//table')
         
         for table in tables:
-            rows = table.find_all('tr')
+            rows = table.xpath('.//tr')
             if len(rows) < 2:
                 continue
                 
             # Enhanced header detection
-            header_cells = rows[0].find_all(['th', 'td'])
-            headers = [th.get_text(strip=True).lower() for th in header_cells]
+            header_cells = rows[0].xpath('./th|./td')
+            headers = [_clean_text(th.text_content()).lower() for th in header_cells]
             
             # Flexible header mapping
             header_map = self.create_header_map(headers)
@@ -179,73 +643,61 @@ class EnhancedSenateExtractor:
                 
             # Extract data rows
             for row in rows[1:]:
-                cells = row.find_all(['td', 'th'])
-                if len(cells) >= 3:
-                    transaction = self.extract_transaction_from_cells(cells, header_map)
+                cell_texts = [_clean_text(cell.text_content()) for cell in row.xpath('./td|./th')]
+                if len(cell_texts) >= 3 and any(cell_texts):
+                    transaction = self.extract_transaction_from_cells(cell_texts, header_map)
                     if transaction:
                         transactions.append(transaction)
         
         return transactions
     
-    def create_header_map(self, headers):
-        """Create flexible header mapping"""
+    def parse_tables_streaming(self, html_bytes):
+        """Table parsing that frees each row once it is read, for very large reports"""
+        transactions = []
+        table = None
         header_map = {}
         
-        # Define possible header names for each field
-        field_mappings = {
-            'asset': ['asset', 'security', 'name', 'description'],
-            'transaction_type': ['transaction', 'type', 'action'],
-            'date': ['date', 'transaction date'],
-            'amount': ['amount', 'value'],
-            'owner': ['owner'],
-            'ticker': ['ticker', 'symbol']
-        }
-        
-        for field, possible_names in field_mappings.items():
-            for idx, header in enumerate(headers):
-                if any(name in header for name in possible_names):
-                    header_map[field] = idx
-                    break
+        for _, row in etree.iterparse(BytesIO(html_bytes), events=('end',), tag='tr', html=True, encoding='utf-8'):
+            cell_texts = [_clean_text(''.join(cell.itertext())) for cell in row.xpath('./td|./th')]
+            
+            # The first row of each table is its header
+            current = next(row.iterancestors('table'), None)
+            if current is not table:
+                table = current
+                header_map = self.create_header_map([text.lower() for text in cell_texts])
+            elif header_map and len(cell_texts) >= 3 and any(cell_texts):
+                transactions.append(self.extract_transaction_from_cells(cell_texts, header_map))
+            
+            # Drop the row and the rows already read before it
+            row.clear()
+            while row.getprevious() is not None:
+                del row.getparent()[0]
         
-        return header_map
+        return transactions
     
-    def extract_transaction_from_cells(self, cells, header_map):
-        """Extract transaction from cells using header map"""
-        cell_texts = [cell.get_text(strip=True) for cell in cells]
-        
-        transaction = {
-            'raw_text': ' | '.join(cell_texts),
-            'cell_count': len(cells)
-        }
-        
+    def create_header_map(self, headers):
+        """Create flexible header mapping"""
+        return dict(_build_header_map(tuple(headers)))
+    
+    def extract_transaction_from_cells(self, cell_texts, header_map):
+        """Extract transaction from cell texts using header map"""
         # Extract fields based on header map
-        if 'asset' in header_map:
-            asset = cell_texts[header_map['asset']]
-            transaction['asset'] = asset
-            transaction['ticker'] = self.extract_ticker(asset)
-        
-        if 'transaction_type' in header_map:
-            transaction['transaction_type'] = cell_texts[header_map['transaction_type']]
+        fields = {field: cell_texts[idx] for field, idx in header_map.items() if idx < len(cell_texts)}
         
-        if 'date' in header_map:
-            transaction['date'] = cell_texts[header_map['date']]
+        if 'asset' in fields:
+            fields['ticker'] = self.extract_ticker(fields['asset'])
         
-        if 'amount' in header_map:
-            transaction['amount'] = cell_texts[header_map['amount']]
+        if 'owner' in fields:
+            fields['relationship'] = self.identify_transaction_owner(fields['owner'])
         
-        if 'owner' in header_map:
-            owner = cell_texts[header_map['owner']]
-            transaction['owner'] = owner
-            transaction['relationship'] = self.identify_transaction_owner(owner)
-        
-        return transaction
+        return Transaction(raw_text=' | '.join(cell_texts), cell_count=len(cell_texts), **fields)
     
     def parse_alternative(self, soup):
         """Alternative parsing for non-standard table formats"""
         transactions = []
         
         # Look for div-based transaction layouts
-        transaction_divs = soup.find_all('div', class_=re.compile(r'transaction|asset', re.I))
+        transaction_divs = soup.select('div[class*="transaction" i], div[class*="asset" i]')
         
         for div in transaction_divs:
             text = div.get_text(strip=True)
@@ -260,65 +712,68 @@ class EnhancedSenateExtractor:
         """Regex-based extraction as last resort"""
         transactions = []
         
-        # Pattern to match transaction-like text blocks
-        transaction_pattern = r'([A-Za-z\s]+)\s*(Purchase|Sale|Exchange)\s*(\d{1,2}/\d{1,2}/\d{4})\s*(\$[\d,]+-\$[\d,]+|\$[\d,]+)'
-        matches = re.findall(transaction_pattern, html_content, re.IGNORECASE)
+        # Only scan the body, not the head's scripts and styles
+        body_start = max(html_content.find('<body'), 0)
+        body_end = html_content.rfind('</body>')
+        if body_end < body_start:
+            body_end = len(html_content)
+        
+        matches = _TX_PATTERN.findall(html_content, body_start, body_end)
         
         for match in matches:
             asset, transaction_type, date, amount = match
-            transaction = {
-                'asset': asset.strip(),
-                'transaction_type': transaction_type,
-                'date': date,
-                'amount': amount,
-                'ticker': self.extract_ticker(asset),
-                'owner': 'self',  # Default
-                'relationship': 'self'
-            }
+            transaction = Transaction(
+                asset=asset.strip(),
+                transaction_type=transaction_type,
+                date=date,
+                amount=amount,
+                ticker=self.extract_ticker(asset),
+                owner='self',  # Default
+                relationship='self'
+            )
             transactions.append(transaction)
         
         return transactions
     
     def is_likely_transaction(self, text):
         """Check if text likely contains transaction data"""
-        keywords = ['purchase', 'sale', 'exchange', 'asset', 'security', '$', 'ticker']
-        return any(keyword.lower() in text.lower() for keyword in keywords)
+        return _TXN_HINT.search(text) is not None
     
     def parse_transaction_text(self, text):
         """Parse transaction from free text"""
         # Extract components using regex
-        asset_match = re.search(r'([A-Za-z\s]+(?:Inc|Corp|LLC|Ltd|ETF)?)', text)
-        type_match = re.search(r'(Purchase|Sale|Exchange)', text, re.IGNORECASE)
-        date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{4})', text)
-        amount_match = re.search(r'(\$[\d,]+-\$[\d,]+|\$[\d,]+)', text)
+        asset_match = _TEXT_ASSET.search(text)
+        type_match = _TEXT_TYPE.search(text)
+        date_match = _TEXT_DATE.search(text)
+        amount_match = _TEXT_AMOUNT.search(text)
         
         if asset_match and type_match and date_match and amount_match:
-            return {
-                'asset': asset_match.group(1).strip(),
-                'transaction_type': type_match.group(1),
-                'date': date_match.group(1),
-                'amount': amount_match.group(1),
-                'ticker': self.extract_ticker(asset_match.group(1)),
-                'owner': 'self',
-                'relationship': 'self'
-            }
+            return Transaction(
+                asset=asset_match.group(1).strip(),
+                transaction_type=type_match.group(1),
+                date=date_match.group(1),
+                amount=amount_match.group(1),
+                ticker=self.extract_ticker(asset_match.group(1)),
+                owner='self',
+                relationship='self'
+            )
         
         return None
     
     def extract_ticker(self, asset_text):
         """Extract ticker symbol with enhanced patterns"""
         # Standard pattern: (AAPL) or [AAPL]
-        match = re.search(r'[(\[]([A-Z]{1,5})[)\]]', asset_text)
+        match = _TICKER_PAREN.search(asset_text)
         if match:
             return match.group(1)
         
         # Alternative pattern: AAPL - 
-        match = re.search(r'([A-Z]{1,5})\s*-', asset_text)
+        match = _TICKER_DASH_R.search(asset_text)
         if match:
             return match.group(1)
         
         # Another pattern: - AAPL
-        match = re.search(r'-\s*([A-Z]{1,5})', asset_text)
+        match = _TICKER_DASH_L.search(asset_text)
         if match:
             return match.group(1)
         
@@ -326,33 +781,43 @@ class EnhancedSenateExtractor:
     
     def identify_transaction_owner(self, asset_text):
         """Identify transaction owner with enhanced patterns"""
-        asset_text = asset_text.lower()
-        
-        # Spouse indicators
-        if any(indicator in asset_text for indicator in ['spouse', 'husband', 'wife', 'joint', 'spousal']):
-            return 'spouse'
+        found = {match.lastgroup for match in _OWNER_RE.finditer(asset_text)}
         
-        # Child indicators
-        if any(indicator in asset_text for indicator in ['child', 'son', 'daughter', 'dependent', 'minor']):
-            return 'child'
-        
-        # Other family
-        if any(indicator in asset_text for indicator in ['family', 'trust', 'estate']):
-            return 'family'
+        # Spouse indicators win over child indicators, which win over other family
+        for owner in ('spouse', 'child', 'family'):
+            if owner in found:
+                return owner
         
         return 'self'
     
-    def process_report(self, report_data):
+    def process_report(self, report_data, html_content=None):
         """Process a single report with enhanced error handling"""
         logger.info(f"Processing report: {report_data['name']}")
         
-        # Download HTML
-        html_content = self.download_report_with_enhanced_retry(report_data)
+        # Download HTML unless it was already fetched by download_reports
+        if html_content is None:
+            html_content = self.download_report_with_enhanced_retry(report_data)
         
         if not html_content:
             logger.error(f"Failed to download report: {report_data['name']}")
             return None
         
+        # Paper filings are recorded as done so later runs don't fetch them again
+        if html_content is self.PAPER_FILING:
+            logger.info(f"Report is a paper filing, nothing to extract: {report_data['name']}")
+            return {
+                'name': report_data['name'],
+                'link': report_data['link'],
+                'date_filed': report_data.get('date_filed'),
+                'office': report_data.get('office'),
+                'report_type': report_data.get('report_type'),
+                'transactions': [],
+                'transaction_count': 0,
+                'extraction_date': datetime.now().isoformat(),
+                'extraction_success': False,
+                'paper_filing': True
+            }
+        
         # Extract transactions
         transactions = self.extract_transactions_with_fallback(html_content)
         
@@ -363,20 +828,23 @@ class EnhancedSenateExtractor:
             'date_filed': report_data.get('date_filed'),
             'office': report_data.get('office'),
             'report_type': report_data.get('report_type'),
-            'transactions': transactions,
+            'transactions': [asdict(transaction) for transaction in transactions],
             'transaction_count': len(transactions),
             'extraction_date': datetime.now().isoformat(),
             'extraction_success': len(transactions) > 0 or 'No transactions' in html_content
         }
         
-        # Save raw HTML for debugging
-        html_file = f"C:\\EMPIRE\\SATORI_Scraper\\data\\raw\\senate\\{report_data['name'].replace(' ', '_')}.html"
-        with open(html_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
+        # Save raw HTML for debugging - the report id keeps one filer's reports apart
+        report_id = report_data['link'].rstrip('/').rsplit('/', 1)[-1]
+        html_file = self.raw_dir / f"{report_data['name'].translate(_NAME_TRANS)}_{report_id}.html.gz"
+        self._writer_executor.submit(_write_gz, html_file, html_content)
         
         return report_result
     
     def close(self):
         """Clean up resources"""
-        if self.driver:
-            self.driver.quit()
\ No newline at end of file
+        if self._driver:
+            self._driver.quit()
+        self.pool.close()
+        self._writer_executor.shutdown(wait=True)
+        self.cache.close()
\ No newline at end of file